@@ -0,0 +1,12 @@
+"""Compatibility shims for supported python versions."""
+
+import sys
+
+if sys.version_info >= (3, 11):
+    BaseExceptionGroup = BaseExceptionGroup
+else:
+    from exceptiongroup import BaseExceptionGroup
+
+__all__ = [
+    "BaseExceptionGroup",
+]
@@ -0,0 +1,51 @@
+"""The event loop shared by async groups and async fixtures."""
+import asyncio
+import warnings
+from typing import Literal, cast
+
+import pytest
+
+
+asyncio_concurrent_loop_key = pytest.StashKey[asyncio.AbstractEventLoop]()
+EventLoopImpl = Literal["asyncio", "uvloop"]
+
+
+def _get_event_loop(config: pytest.Config) -> asyncio.AbstractEventLoop:
+    """
+    The event loop running async groups and async fixtures, shared across the session.
+    Created on first use and set as current event loop, closed on unconfigure.
+    """
+    loop = config.stash.get(asyncio_concurrent_loop_key, None)
+    if loop is None or loop.is_closed():
+        if _get_event_loop_impl(config) == "uvloop":
+            import uvloop
+
+            loop = uvloop.new_event_loop()
+        else:
+            loop = asyncio.new_event_loop()
+
+        config.stash[asyncio_concurrent_loop_key] = loop
+        asyncio.set_event_loop(loop)
+
+    return loop
+
+
+def _is_current_event_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    # The loop got set as current on creation, so looking it up never creates a new one.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            return asyncio.get_event_loop() is loop
+        except RuntimeError:
+            return False
+
+
+def _get_event_loop_impl(config: pytest.Config) -> EventLoopImpl:
+    impl = (
+        config.getoption("--event-loop") or config.getini("event_loop") or "asyncio"
+    ).lower()
+    if impl != "asyncio" and impl != "uvloop":
+        raise pytest.UsageError(
+            f"asyncio-concurrent: event_loop should be either asyncio or uvloop, got '{impl}'."
+        )
+    return cast(EventLoopImpl, impl)
@@ -1,43 +1,60 @@
 import copy
 import inspect
-import asyncio
 import functools
+import weakref
 
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Callable, Dict, Optional, Sequence
 import warnings
 
 import pytest
 from _pytest import fixtures
 from _pytest import nodes
+from _pytest.scope import Scope
+
+from ._loop import _get_event_loop
 
 
 @pytest.hookimpl(specname="pytest_fixture_setup", tryfirst=True)
 def pytest_fixture_setup_wrap_async(
     fixturedef: pytest.FixtureDef, request: pytest.FixtureRequest
 ) -> None:
-    _wrap_async_fixture(fixturedef)
+    _wrap_async_fixture(fixturedef, request.config)
+
+
+FixtureWrapper = Callable[[pytest.FixtureDef, pytest.Config], None]
+_fixture_wrappers: "weakref.WeakKeyDictionary[Callable, Optional[FixtureWrapper]]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
-def _wrap_async_fixture(fixturedef: pytest.FixtureDef) -> None:
+def _wrap_async_fixture(fixturedef: pytest.FixtureDef, config: pytest.Config) -> None:
     """Wraps the fixture function of an async fixture in a synchronous function."""
-    if inspect.isasyncgenfunction(fixturedef.func):
-        _wrap_asyncgen_fixture(fixturedef)
-    elif inspect.iscoroutinefunction(fixturedef.func):
-        _wrap_asyncfunc_fixture(fixturedef)
+    # Fixture setup runs for every test, remember which wrapper applies to a function
+    # instead of inspecting it again, the wrapped function itself is cached as sync.
+    fixtureFunc = fixturedef.func
+    if fixtureFunc in _fixture_wrappers:
+        wrapper = _fixture_wrappers[fixtureFunc]
+    else:
+        if inspect.isasyncgenfunction(fixtureFunc):
+            wrapper = _wrap_asyncgen_fixture
+        elif inspect.iscoroutinefunction(fixtureFunc):
+            wrapper = _wrap_asyncfunc_fixture
+        else:
+            wrapper = None
+        _fixture_wrappers[fixtureFunc] = wrapper
 
+    if wrapper is not None:
+        wrapper(fixturedef, config)
 
-def _wrap_asyncgen_fixture(fixturedef: pytest.FixtureDef) -> None:
+
+def _wrap_asyncgen_fixture(fixturedef: pytest.FixtureDef, config: pytest.Config) -> None:
     fixtureFunc = fixturedef.func
 
     @functools.wraps(fixtureFunc)
     def _asyncgen_fixture_wrapper(**kwargs: Any):
-        event_loop = asyncio.get_event_loop()
+        event_loop = _get_event_loop(config)
         gen_obj = fixtureFunc(**kwargs)
 
-        async def setup():
-            res = await gen_obj.__anext__()  # type: ignore[union-attr]
-            return res
-
         async def teardown() -> None:
             try:
                 await gen_obj.__anext__()  # type: ignore[union-attr]
@@ -48,25 +65,20 @@ def _wrap_asyncgen_fixture(fixturedef: pytest.FixtureDef) -> None:
                 msg += "Yield only once."
                 raise ValueError(msg)
 
-        result = event_loop.run_until_complete(setup())
+        result = event_loop.run_until_complete(gen_obj.__anext__())  # type: ignore[union-attr]
         yield result
         event_loop.run_until_complete(teardown())
 
     fixturedef.func = _asyncgen_fixture_wrapper  # type: ignore[misc]
 
 
-def _wrap_asyncfunc_fixture(fixturedef: pytest.FixtureDef) -> None:
+def _wrap_asyncfunc_fixture(fixturedef: pytest.FixtureDef, config: pytest.Config) -> None:
     fixtureFunc = fixturedef.func
 
     @functools.wraps(fixtureFunc)
     def _async_fixture_wrapper(**kwargs: Dict[str, Any]):
-        event_loop = asyncio.get_event_loop()
-
-        async def setup():
-            res = await fixtureFunc(**kwargs)
-            return res
-
-        return event_loop.run_until_complete(setup())
+        event_loop = _get_event_loop(config)
+        return event_loop.run_until_complete(fixtureFunc(**kwargs))
 
     fixturedef.func = _async_fixture_wrapper  # type: ignore[misc]
 
@@ -105,14 +117,13 @@ def pytest_sessionstart_cache_fixture(session: pytest.Session):
         argname: str,
         node: nodes.Node,
     ) -> Optional[Sequence[pytest.FixtureDef[Any]]]:
-        if fixture_cache_key not in node.stash:
-            node.stash[fixture_cache_key] = {}
-
-        cache = node.stash[fixture_cache_key]
+        cache = node.stash.setdefault(fixture_cache_key, {})
         if argname not in cache:
             fixtureDefs = getfixturedefs_original(argname, node)
 
-            if fixtureDefs:
+            # Only the last FixtureDef is used directly, the earlier ones are only reachable
+            # by overriding it, and a wider scoped fixture can not request a function one.
+            if fixtureDefs and fixtureDefs[-1]._scope is Scope.Function:
                 fixtureDefs = tuple(_clone_function_fixture(fixDef) for fixDef in fixtureDefs)
 
             cache[argname] = fixtureDefs
@@ -123,10 +134,11 @@ def pytest_sessionstart_cache_fixture(session: pytest.Session):
 
 
 def _clone_function_fixture(fixtureDef: pytest.FixtureDef) -> pytest.FixtureDef:
-    if fixtureDef.scope != "function":
+    if fixtureDef._scope is not Scope.Function:
         return fixtureDef
 
     new_fixdef = copy.copy(fixtureDef)
+    new_fixdef.cached_result = None
     if hasattr(fixtureDef, "_finalizers"):
         new_fixdef._finalizers = []  # type: ignore
     else:
@@ -1,15 +1,17 @@
 import copy
-import sys
 import dataclasses
 from typing import Any, Callable, Dict, List
 
 import pytest
 from _pytest import fixtures
 from _pytest import outcomes
+from _pytest.scope import Scope
 
+from ._compat import BaseExceptionGroup
 
-if sys.version_info < (3, 11):
-    from exceptiongroup import BaseExceptionGroup
+
+fixture_refreshed_key = pytest.StashKey[bool]()
+skip_marker = pytest.mark.skip
 
 
 class PytestAsyncioConcurrentGroupingWarning(pytest.PytestWarning):
@@ -31,7 +33,7 @@ class AsyncioConcurrentGroup(pytest.Function):
     and in charging of holding and tearing down the finalizers from all children nodes.
     """
 
-    children: List["AsyncioConcurrentGroupMember"]
+    children: Dict["AsyncioConcurrentGroupMember", None]
     children_have_same_parent: bool
     children_finalizer: Dict["AsyncioConcurrentGroupMember", List[Callable[[], Any]]]
     has_setup: bool
@@ -43,7 +45,7 @@ class AsyncioConcurrentGroup(pytest.Function):
     ):
         self.children_have_same_parent = True
         self.has_setup = False
-        self.children = []
+        self.children = {}
         self.children_finalizer = {}
         super().__init__(
             name=originalname,
@@ -58,40 +60,41 @@ class AsyncioConcurrentGroup(pytest.Function):
         pass
 
     def add_child(self, item: "AsyncioConcurrentGroupMember") -> None:
-        child_parent = list(item.iter_parents())[1]
-
-        if child_parent is not self.parent:
+        # Existing children only need skipping the first time the rule got violated.
+        if item.parent is not self.parent and self.children_have_same_parent:
             self.children_have_same_parent = False
             for child in self.children:
-                child.add_marker("skip")
+                child.add_marker(skip_marker)
 
         if not self.children_have_same_parent:
-            item.add_marker("skip")
+            item.add_marker(skip_marker)
 
         item.group = self
-        self.children.append(item)
+        self.children[item] = None
         self.children_finalizer[item] = []
 
     def teardown_child(self, item: "AsyncioConcurrentGroupMember") -> None:
         finalizers = self.children_finalizer.pop(item)
-        exceptions = []
+        exceptions: List[BaseException] = []
+        pop_finalizer = finalizers.pop
+        add_exception = exceptions.append
 
         while finalizers:
-            fin = finalizers.pop()
+            fin = pop_finalizer()
             try:
                 fin()
             except outcomes.TEST_OUTCOME as e:
-                exceptions.append(e)
+                add_exception(e)
 
         if len(exceptions) == 1:
             raise exceptions[0]
         elif len(exceptions) > 1:
             msg = f"errors while tearing down {item!r}"
-            raise BaseExceptionGroup(msg, exceptions[::-1])
+            exceptions.reverse()
+            raise BaseExceptionGroup(msg, exceptions)
 
     def remove_child(self, item: "AsyncioConcurrentGroupMember") -> None:
-        assert item in self.children
-        self.children.remove(item)
+        self.children.pop(item)
         self.children_finalizer.pop(item)
 
 
@@ -131,7 +134,18 @@ class AsyncioConcurrentGroupMember(pytest.Function):
         # on collection, which means they all share same fixture infomation.
         # Have to refresh fixtureDef here to get their own their own fixtureDef
 
-        if not hasattr(item, "callspec"):
+        if not hasattr(item, "callspec") or item.stash.get(fixture_refreshed_key, False):
+            return
+        item.stash[fixture_refreshed_key] = True
+
+        # Only function scoped fixtures are cloned per node, nothing to refresh otherwise.
+        # Parametrized args are kept as they are, their pseudo FixtureDef is function scoped.
+        params = item.callspec.params
+        if not any(
+            fixtureDefs[-1]._scope is Scope.Function
+            for name, fixtureDefs in item._fixtureinfo.name2fixturedefs.items()
+            if name not in params
+        ):
             return
 
         fixtureManager: fixtures.FixtureManager = item.config.pluginmanager.get_plugin(
@@ -139,9 +153,9 @@ class AsyncioConcurrentGroupMember(pytest.Function):
         )  # type: ignore
 
         new_name2fixturedefs = {}
-        for name in item._fixtureinfo.name2fixturedefs.keys():
-            if name in item.callspec.params.keys():
-                new_name2fixturedefs[name] = item._fixtureinfo.name2fixturedefs[name]
+        for name, fixtureDefs in item._fixtureinfo.name2fixturedefs.items():
+            if name in params:
+                new_name2fixturedefs[name] = fixtureDefs
             else:
                 new_name2fixturedefs[name] = fixtureManager.getfixturedefs(
                     name, item
@@ -16,6 +16,8 @@ from typing import (
     Coroutine,
     Dict,
     Sequence,
+    Tuple,
+    Type,
     Union,
     cast,
 )
@@ -25,6 +27,13 @@ import pytest
 from _pytest import timing
 from _pytest import outcomes
 
+from ._compat import BaseExceptionGroup
+from ._loop import (
+    asyncio_concurrent_loop_key,
+    _get_event_loop,
+    _get_event_loop_impl,
+    _is_current_event_loop,
+)
 from .grouping import (
     AsyncioConcurrentGroup,
     AsyncioConcurrentGroupMember,
@@ -32,13 +41,13 @@ from .grouping import (
     PytestAsyncioConcurrentGroupingWarning,
 )
 
-if sys.version_info < (3, 11):
-    from exceptiongroup import BaseExceptionGroup
-
 
 # =========================== # Config # =========================== #
 
 asyncio_concurrent_group_key = pytest.StashKey[Dict[str, AsyncioConcurrentGroup]]()
+asyncio_concurrent_mark_key = pytest.StashKey[pytest.Mark]()
+asyncio_concurrent_hook_caller_key = pytest.StashKey[Dict[str, pluggy.HookCaller]]()
+asyncio_concurrent_reraise_key = pytest.StashKey[Tuple[Type[BaseException], ...]]()
 GroupStrategy = Literal["self", "parent"]
 
 
@@ -55,15 +64,65 @@ def pytest_addoption(parser: pytest.Parser):
             please refer to documentation for more info.",
         default="self",
     )
+    parser.addoption(
+        "--event-loop",
+        choices=["asyncio", "uvloop"],
+        help="asyncio-concurrent: event loop implementation running async tests, \
+            uvloop requires the uvloop package installed.",
+    )
+    parser.addini(
+        "event_loop",
+        "asyncio-concurrent: event loop implementation running async tests, \
+            uvloop requires the uvloop package installed.",
+        default="asyncio",
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line(
         "markers",
-        "asyncio_concurrent(group, timeout): " "mark the async tests to run concurrently",
+        "asyncio_concurrent(group, timeout, max_concurrency): "
+        "mark the async tests to run concurrently",
     )
     config.stash[asyncio_concurrent_group_key] = {}
 
+    # Exceptions escaping setup and teardown, KeyboardInterrupt is left to pdb if enabled.
+    reraise: Tuple[Type[BaseException], ...] = (outcomes.Exit,)
+    if not config.getoption("usepdb", False):
+        reraise += (KeyboardInterrupt,)
+    config.stash[asyncio_concurrent_reraise_key] = reraise
+
+    if _get_event_loop_impl(config) == "uvloop":
+        try:
+            import uvloop  # noqa: F401
+        except ImportError:
+            raise pytest.UsageError(
+                "asyncio-concurrent: event_loop 'uvloop' requires the uvloop package installed."
+            )
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    loop = config.stash.get(asyncio_concurrent_loop_key, None)
+    if loop is None or loop.is_closed():
+        return
+
+    # Same clean up as asyncio.Runner.close, which is not available before python 3.11.
+    try:
+        # gather() without tasks would bind to the current loop, which may not be this one.
+        tasks = asyncio.all_tasks(loop)
+        if tasks:
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        if sys.version_info >= (3, 9):
+            loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        # Others like pytest-asyncio or asyncio.run may have replaced the current loop since.
+        if _is_current_event_loop(loop):
+            asyncio.set_event_loop(None)
+        loop.close()
+
 
 @pytest.hookimpl
 def pytest_addhooks(pluginmanager: pytest.PytestPluginManager) -> None:
@@ -93,16 +152,30 @@ def pytest_pycollect_makeitem_make_group_and_member(
 
     result = []
     for item_or_collector in ori_result:
-        if (
-            not isinstance(item_or_collector, pytest.Function)
-            or _get_asyncio_concurrent_mark(item_or_collector) is None
-        ):
+        mark = (
+            _get_asyncio_concurrent_mark(item_or_collector)
+            if isinstance(item_or_collector, pytest.Function)
+            else None
+        )
+        if mark is None:
             result.append(item_or_collector)
             continue
 
         item = item_or_collector
 
         item = AsyncioConcurrentGroupMember.promote_from_function(item)
+        item.stash[asyncio_concurrent_mark_key] = mark
+        if not inspect.iscoroutinefunction(item.obj):
+            warnings.warn(
+                PytestAsyncioConcurrentInvalidMarkWarning(
+                    "Marking a sync function with @asyncio_concurrent is invalid."
+                )
+            )
+            item.add_marker(
+                pytest.mark.skip(
+                    reason="Marking a sync function with @asyncio_concurrent is invalid."
+                )
+            )
         result.append(item)
 
     return result
@@ -113,14 +186,15 @@ def pytest_itemcollected_register_in_group(item: pytest.Item) -> None:
     if not isinstance(item, AsyncioConcurrentGroupMember):
         return
 
+    _validate_max_concurrency(item)
     known_groups = item.config.stash[asyncio_concurrent_group_key]
 
     group_name = _get_asyncio_concurrent_group(item)
-    if group_name not in known_groups:
-        known_groups[group_name] = AsyncioConcurrentGroup.from_parent(
+    group = known_groups.get(group_name)
+    if group is None:
+        group = known_groups[group_name] = AsyncioConcurrentGroup.from_parent(
             parent=item.parent, originalname=f"AsyncioConcurrentGroup[{group_name}]"
         )
-    group = known_groups[group_name]
 
     group.add_child(item)
 
@@ -147,17 +221,20 @@ def pytest_runtestloop_handle_async_by_group(session: pytest.Session) -> Generat
     - Handle async tests by group, one at a time.
     - Ungroup them after everything done.
     """
+    # No async group got collected, nothing to split out of the session.
+    if not session.config.stash[asyncio_concurrent_group_key]:
+        return (yield)
+
     items = session.items
     ihook = session.ihook
 
     asyncio_concurrent_tests = [
         item for item in items if isinstance(item, AsyncioConcurrentGroupMember)
     ]
-    groups: List[AsyncioConcurrentGroup] = []
-    for async_test in asyncio_concurrent_tests:
-        if async_test.group not in groups:
-            groups.append(async_test.group)
-        items.remove(async_test)
+    groups: List[AsyncioConcurrentGroup] = list(
+        dict.fromkeys(async_test.group for async_test in asyncio_concurrent_tests)
+    )
+    items[:] = [item for item in items if not isinstance(item, AsyncioConcurrentGroupMember)]
 
     assert sum([len(group.children) for group in groups]) == len(asyncio_concurrent_tests)
 
@@ -194,10 +271,8 @@ def pytest_runtest_protocol_async_group(
     - pytest_runtest_logfinish (batch)
     """
 
+    # Children were already marked skipped by AsyncioConcurrentGroup.add_child.
     if not group.children_have_same_parent:
-        for child in group.children:
-            child.add_marker("skip")
-
         warnings.warn(
             PytestAsyncioConcurrentGroupingWarning(
                 f"""
@@ -207,11 +282,17 @@ def pytest_runtest_protocol_async_group(
             )
         )
 
+    # Children under the same parent share the hook proxy of their group, resolve it once.
+    if group.children_have_same_parent:
+        ihooks = dict.fromkeys(group.children, group.ihook)
+    else:
+        ihooks = {child: child.ihook for child in group.children}
+
     item_passed_setup: List[AsyncioConcurrentGroupMember] = []
-    loop = asyncio.get_event_loop()
+    loop = _get_event_loop(group.config)
 
     for childFunc in group.children:
-        childFunc.ihook.pytest_runtest_logstart(
+        ihooks[childFunc].pytest_runtest_logstart(
             nodeid=childFunc.nodeid, location=childFunc.location
         )
 
@@ -219,20 +300,25 @@ def pytest_runtest_protocol_async_group(
         if report.passed:
             item_passed_setup.append(childFunc)
 
-    coros = [_call_runtest_async(childFunc) for childFunc in item_passed_setup]
-    callinfos = loop.run_until_complete(asyncio.gather(*coros))
+    # Nothing to run when every child failed or skipped on setup, leave the loop idle.
+    callinfos: List[pytest.CallInfo] = []
+    if item_passed_setup:
+        coros = [_call_runtest_async(childFunc) for childFunc in item_passed_setup]
+        max_concurrency = _get_max_concurrency(group)
+        callinfos = loop.run_until_complete(_run_concurrently(coros, max_concurrency))
 
     for childFunc, callinfo in zip(item_passed_setup, callinfos):
-        report = childFunc.ihook.pytest_runtest_makereport(item=childFunc, call=callinfo)
+        ihook = ihooks[childFunc]
+        report = ihook.pytest_runtest_makereport(item=childFunc, call=callinfo)
         if _check_interactive_exception(call=callinfo, report=report):
-            childFunc.ihook.pytest_exception_interact(node=childFunc, call=callinfo, report=report)
+            ihook.pytest_exception_interact(node=childFunc, call=callinfo, report=report)
 
-        childFunc.ihook.pytest_runtest_logreport(report=report)
+        ihook.pytest_runtest_logreport(report=report)
 
     for childFunc in group.children:
         _call_and_report(_teardown_child(childFunc, nextgroup=nextgroup), childFunc, "teardown")
 
-        childFunc.ihook.pytest_runtest_logfinish(
+        ihooks[childFunc].pytest_runtest_logfinish(
             nodeid=childFunc.nodeid, location=childFunc.location
         )
 
@@ -240,8 +326,7 @@ def pytest_runtest_protocol_async_group(
 
 
 async def _call_runtest_async(item: AsyncioConcurrentGroupMember) -> pytest.CallInfo:
-    mark = _get_asyncio_concurrent_mark(item)
-    assert mark
+    mark = item.stash[asyncio_concurrent_mark_key]
     timeout = mark.kwargs.get("timeout")
 
     return await _async_callinfo_from_call(
@@ -250,6 +335,41 @@ async def _call_runtest_async(item: AsyncioConcurrentGroupMember) -> pytest.Call
     )
 
 
+async def _run_concurrently(
+    coros: List[Coroutine[Any, Any, pytest.CallInfo]],
+    max_concurrency: Optional[int] = None,
+) -> List[pytest.CallInfo]:
+    """
+    Run the coroutines concurrently and collect their results in order.
+    With max_concurrency, at most that many coroutines run at once, the rest wait to start,
+    so the waiting does not count towards their duration or timeout.
+    Where supported the tasks start eagerly, so tests finishing without ever suspending
+    skip a trip through the scheduler. Only these tasks are eager, the loop task factory
+    is left untouched for tasks created by the tests themselves.
+    A single coroutine has nothing to run alongside, it is awaited directly.
+    """
+    if len(coros) == 1:
+        return [await coros[0]]
+
+    if max_concurrency is not None and max_concurrency < len(coros):
+        semaphore = asyncio.Semaphore(max_concurrency)
+        coros = [_run_bounded(coro, semaphore) for coro in coros]
+
+    if sys.version_info < (3, 12):
+        return await asyncio.gather(*coros)
+
+    loop = asyncio.get_running_loop()
+    tasks = [asyncio.eager_task_factory(loop, coro) for coro in coros]
+    return await asyncio.gather(*tasks)
+
+
+async def _run_bounded(
+    coro: Coroutine[Any, Any, pytest.CallInfo], semaphore: asyncio.Semaphore
+) -> pytest.CallInfo:
+    async with semaphore:
+        return await coro
+
+
 def _setup_child(item: AsyncioConcurrentGroupMember) -> Callable[[], None]:
     """
     Setup flow for normal pytest tests:
@@ -269,9 +389,7 @@ def _setup_child(item: AsyncioConcurrentGroupMember) -> Callable[[], None]:
         if not item.group.has_setup:
             item.ihook.pytest_runtest_setup_async_group(item=item.group)
 
-        item.config.pluginmanager.subset_hook_caller(
-            "pytest_runtest_setup", [item.config.pluginmanager.get_plugin("runner")]
-        )(item=item)
+        _get_hook_caller_without_runner(item.config, "pytest_runtest_setup")(item=item)
 
     return inner
 
@@ -295,9 +413,9 @@ def _teardown_child(
     def inner() -> None:
         exceptions = []
         try:
-            item.config.pluginmanager.subset_hook_caller(
-                "pytest_runtest_teardown", [item.config.pluginmanager.get_plugin("runner")]
-            )(item=item, nextitem=nextgroup)
+            _get_hook_caller_without_runner(item.config, "pytest_runtest_teardown")(
+                item=item, nextitem=nextgroup
+            )
         except Exception as e:
             exceptions.append(e)
 
@@ -324,18 +442,15 @@ def _teardown_child(
 
 @pytest.hookimpl(specname="pytest_runtest_call_async")
 async def pytest_runtest_call_async(item: pytest.Function) -> object:
-    if not inspect.iscoroutinefunction(item.obj):
-        warnings.warn(
-            PytestAsyncioConcurrentInvalidMarkWarning(
-                "Marking a sync function with @asyncio_concurrent is invalid."
-            )
-        )
-
-        pytest.skip("Marking a sync function with @asyncio_concurrent is invalid.")
-
     with hook_wrapper_entered(item.ihook.pytest_runtest_call, item=item):
         testfunction = item.obj
-        testargs = {arg: item.funcargs[arg] for arg in item._fixtureinfo.argnames}
+        argnames = item._fixtureinfo.argnames
+        funcargs = item.funcargs
+        # funcargs holds every fixture in the closure, argnames are its subset the test takes.
+        if len(funcargs) == len(argnames):
+            testargs = funcargs
+        else:
+            testargs = {arg: funcargs[arg] for arg in argnames}
         return await testfunction(**testargs)
 
 
@@ -401,21 +516,64 @@ def pytest_runtest_protocol_async_group_warning(
 # =========================== # helper #===========================#
 
 
+def _get_hook_caller_without_runner(config: pytest.Config, name: str) -> pluggy.HookCaller:
+    """
+    Hook caller skipping the implementation from pytest.runner, cached per config.
+    Subset hook callers are live views of the original hook, so caching them is safe.
+    """
+    hook_callers = config.stash.setdefault(asyncio_concurrent_hook_caller_key, {})
+    if name not in hook_callers:
+        hook_callers[name] = config.pluginmanager.subset_hook_caller(
+            name, [config.pluginmanager.get_plugin("runner")]
+        )
+
+    return hook_callers[name]
+
+
 def _get_asyncio_concurrent_mark(item: pytest.Item) -> Optional[pytest.Mark]:
     return item.get_closest_marker("asyncio_concurrent")
 
 
 def _get_asyncio_concurrent_group(item: AsyncioConcurrentGroupMember) -> str:
-    marker = item.get_closest_marker("asyncio_concurrent")
-    assert marker is not None
+    marker = item.stash[asyncio_concurrent_mark_key]
+    if "group" in marker.kwargs:
+        return marker.kwargs["group"]
 
-    default_group_name = (
+    return (
         f"self_[{item.nodeid}]"
         if _get_group_strategy(item.config) == "self"
         else f"parent_[{item.parent.nodeid}]"  # type: ignore
     )
 
-    return marker.kwargs.get("group", default_group_name)
+
+def _get_max_concurrency(group: AsyncioConcurrentGroup) -> Optional[int]:
+    """The smallest max_concurrency given by the marks of the group children, if any."""
+    limits = [
+        child.stash[asyncio_concurrent_mark_key].kwargs["max_concurrency"]
+        for child in group.children
+        if "max_concurrency" in child.stash[asyncio_concurrent_mark_key].kwargs
+    ]
+    if not limits:
+        return None
+
+    return min(limits)
+
+
+def _validate_max_concurrency(item: AsyncioConcurrentGroupMember) -> None:
+    marker = item.stash[asyncio_concurrent_mark_key]
+    if "max_concurrency" not in marker.kwargs:
+        return
+
+    max_concurrency = marker.kwargs["max_concurrency"]
+    if (
+        isinstance(max_concurrency, bool)
+        or not isinstance(max_concurrency, int)
+        or max_concurrency < 1
+    ):
+        raise pytest.UsageError(
+            f"asyncio-concurrent: max_concurrency of {item.nodeid} should be a positive integer, "
+            f"got {max_concurrency!r}."
+        )
 
 
 @functools.lru_cache(maxsize=1)
@@ -450,7 +608,7 @@ async def _async_callinfo_from_call(
 
     precise_stop = timing.perf_counter()
     duration = precise_stop - precise_start
-    stop = timing.time()
+    stop = start + duration
 
     callInfo: pytest.CallInfo = pytest.CallInfo(
         start=start,
@@ -471,10 +629,7 @@ def _call_and_report(
     item: pytest.Item,
     when: Literal["setup", "teardown"],
 ) -> pytest.TestReport:
-    reraise: tuple[type[BaseException], ...] = (outcomes.Exit,)
-    if not item.config.getoption("usepdb", False):
-        reraise += (KeyboardInterrupt,)
-
+    reraise = item.config.stash[asyncio_concurrent_reraise_key]
     call = pytest.CallInfo.from_call(func, when=when, reraise=reraise)
     report: pytest.TestReport = item.ihook.pytest_runtest_makereport(item=item, call=call)
     item.ihook.pytest_runtest_logreport(report=report)
@@ -9,7 +9,7 @@ def pytester_add_ini(pytester: pytest.Pytester) -> Generator[None, None, None]:
     pytester.makeini(
         """
         [pytest]
-        addopts = -p no:asyncio
+        addopts = -p no:asyncio -p no:cacheprovider -p no:stepwise
         """
     )
     yield
@@ -137,3 +137,60 @@ def test_async_gen_fixture_error(pytester: pytest.Pytester):
     result = pytester.runpytest()
 
     result.assert_outcomes(passed=1, errors=1)
+
+
+def test_async_fixture_same_event_loop(pytester: pytest.Pytester):
+    """Make sure that async fixtures and tests in groups share the same event loop"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture(scope="module")
+            async def async_fixture_loop():
+                yield asyncio.get_running_loop()
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_loop_A(async_fixture_loop):
+                assert asyncio.get_running_loop() is async_fixture_loop
+
+            @pytest.mark.asyncio_concurrent(group="B")
+            async def test_loop_B(async_fixture_loop):
+                assert asyncio.get_running_loop() is async_fixture_loop
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=2)
+
+
+def test_async_fixture_then_asyncio_run(pytester: pytest.Pytester):
+    """Make sure that session clean up survives sync tests replacing the current event loop"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture(scope="function")
+            async def async_fixture_function():
+                return 1
+
+            def test_fixture_sync(async_fixture_function):
+                assert async_fixture_function == 1
+
+            def test_asyncio_run():
+                asyncio.run(asyncio.sleep(0))
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    assert result.ret == pytest.ExitCode.OK
+    result.assert_outcomes(passed=2)
@@ -26,7 +26,7 @@ def test_compatibility_with_pytest_asyncio(pytester: pytest.Pytester):
         """
         [pytest]
         asyncio_default_fixture_loop_scope=function
-        addopts = -p no:sugar
+        addopts = -p no:sugar -p no:cacheprovider -p no:stepwise
         """
     )
 
@@ -0,0 +1,121 @@
+import sys
+from textwrap import dedent
+import pytest
+
+
+def test_event_loop__ini_asyncio(pytester: pytest.Pytester):
+    """Make sure that tests run on the default asyncio event loop"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_loop_A():
+                assert type(asyncio.get_running_loop()).__module__.startswith("asyncio")
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_loop_B():
+                assert type(asyncio.get_running_loop()).__module__.startswith("asyncio")
+            """
+        )
+    )
+
+    pytester.makeini(
+        dedent(
+            """\
+        [pytest]
+        event_loop = asyncio
+        addopts = -p no:asyncio -p no:cacheprovider -p no:stepwise
+        """
+        )
+    )
+
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+def test_event_loop__cli_uvloop(pytester: pytest.Pytester):
+    """Make sure that tests and async fixtures run on uvloop when asked"""
+
+    pytest.importorskip("uvloop")
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+            import uvloop
+
+            @pytest.fixture
+            async def fixture_loop():
+                yield asyncio.get_running_loop()
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_loop_A(fixture_loop):
+                assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
+                assert asyncio.get_running_loop() is fixture_loop
+
+            @pytest.mark.asyncio_concurrent(group="A")
+            async def test_loop_B():
+                assert isinstance(asyncio.get_running_loop(), uvloop.Loop)
+            """
+        )
+    )
+
+    result = pytester.runpytest("--event-loop=uvloop")
+    result.assert_outcomes(passed=2)
+
+
+def test_event_loop__cli_uvloop_missing(pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch):
+    """Make sure that asking for uvloop without it installed got rejected"""
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent
+            async def test_loop():
+                await asyncio.sleep(0.1)
+            """
+        )
+    )
+
+    result = pytester.runpytest("--event-loop=uvloop")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+
+
+def test_event_loop__ini_invalid(pytester: pytest.Pytester):
+    """Make sure that unknown event loop got rejected"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent
+            async def test_loop():
+                await asyncio.sleep(0.1)
+            """
+        )
+    )
+
+    pytester.makeini(
+        dedent(
+            """\
+        [pytest]
+        event_loop = trio
+        addopts = -p no:asyncio -p no:cacheprovider -p no:stepwise
+        """
+        )
+    )
+
+    result = pytester.runpytest()
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
@@ -341,3 +341,44 @@ def test_dynamic_fixture_isolation(pytester: pytest.Pytester):
 
     result = pytester.runpytest()
     result.assert_outcomes(passed=3)
+
+
+def test_parametrized_fixtureinfo_kept(pytester: pytest.Pytester):
+    """
+    Make sure parametrized tests using only non function scoped fixtures
+    keep sharing their original fixture information.
+    """
+
+    pytester.makeconftest(
+        dedent(
+            """\
+            import pytest
+
+            def pytest_collection_modifyitems(items):
+                assert len({id(item._fixtureinfo) for item in items}) == 1
+            """
+        )
+    )
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.fixture(scope="session")
+            def fixture_session():
+                yield []
+
+            @pytest.mark.asyncio_concurrent(group="any")
+            @pytest.mark.parametrize("p", [1, 2])
+            async def test_parametrize_session(fixture_session, p):
+                fixture_session.append(p)
+                assert len(fixture_session) <= 2
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+    assert result.ret == pytest.ExitCode.OK
+    result.assert_outcomes(passed=2)
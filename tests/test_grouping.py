@@ -136,3 +136,87 @@ def test_parametrize_with_group(pytester: pytest.Pytester):
 
     result.assert_outcomes(passed=3)
     assert result.duration < 0.3
+
+
+def test_groups_max_concurrency(pytester: pytest.Pytester):
+    """Make sure no more than max_concurrency tests in a group run at the same time"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            g_running = 0
+            g_max_running = 0
+
+            @pytest.mark.parametrize("p", [0, 1, 2, 3])
+            @pytest.mark.asyncio_concurrent(group="A", max_concurrency=2)
+            async def test_max_concurrency(p):
+                global g_running, g_max_running
+                g_running += 1
+                g_max_running = max(g_max_running, g_running)
+                await asyncio.sleep(0.1)
+                g_running -= 1
+
+                assert g_max_running == 2
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    result.assert_outcomes(passed=4)
+    assert result.duration >= 0.2
+
+
+def test_groups_max_concurrency_invalid(pytester: pytest.Pytester):
+    """Make sure non positive max_concurrency got rejected"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent(group="A", max_concurrency=2)
+            async def test_max_concurrency_A():
+                await asyncio.sleep(0.1)
+
+            @pytest.mark.asyncio_concurrent(group="A", max_concurrency=0)
+            async def test_max_concurrency_B():
+                await asyncio.sleep(0.1)
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.assert_outcomes()
+
+
+def test_groups_max_concurrency_not_int(pytester: pytest.Pytester):
+    """Make sure non integer max_concurrency got rejected"""
+
+    pytester.makepyfile(
+        dedent(
+            """\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio_concurrent(group="A", max_concurrency=True)
+            async def test_max_concurrency_A():
+                await asyncio.sleep(0.1)
+
+            @pytest.mark.asyncio_concurrent(group="A", max_concurrency="2")
+            async def test_max_concurrency_B():
+                await asyncio.sleep(0.1)
+            """
+        )
+    )
+
+    result = pytester.runpytest()
+
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.assert_outcomes()
@@ -139,7 +139,7 @@ def test_parent_group_strategy__ini_seperate_file(pytester: pytest.Pytester):
             """\
         [pytest]
         default_group_strategy = parent
-        addopts = -p no:asyncio
+        addopts = -p no:asyncio -p no:cacheprovider -p no:stepwise
         """
         )
     )
@@ -200,7 +200,7 @@ def test_parent_group_strategy__ini_invalid(pytester: pytest.Pytester):
             """\
         [pytest]
         default_group_strategy = class
-        addopts = -p no:sugar no:asyncio
+        addopts = -p no:sugar no:asyncio -p no:cacheprovider -p no:stepwise
         """
         )
     )